@@ -1,3 +1,13 @@
+import array
+import operator
+
+import numpy as np
+
+try: #Numba is an optional dependency, the JIT compiled kernels are used when available and everything falls back to pure Python otherwise
+  import galoisfield_numba
+except ImportError:
+  galoisfield_numba = None
+
 class GaloisField: #Will represent finite fields (Z/p)[x]/f(x) (polynomials with coeficients from finite field Z/p (integers modulo p) modulo a prime polynomial f(x) of degree n) with size p^n written as GF(p^n)
   """
   Create a Galois Field GF(p^n) with a primitive element 'alpha' and a primitive polynomial 'prim_poly'. The parameter 'p' refers to the prime with which we construct element polynomials of the field using coefficients from Z/p (integers modulo 'p'). The parameter 'n' is the power we raise the prime number to recieve the field size/cap (the highest number representing a polynomial). The parameters 'alpha' and 'prim_poly' are numbers refering to polynomials (like elements of GF) when expressed in number system 'p' (example: when p=2, the number 11 or 1011 in binary represents [x^3 + x + 1]). 'prim_poly' must be an irreducible polynomial of degree 'n' with we modulo to create the field. 'alpha' must be a primitive element of the field (meaning it can create all the other elements when raised to different powers).
@@ -22,30 +32,84 @@ class GaloisField: #Will represent finite fields (Z/p)[x]/f(x) (polynomials with
 
     self.size = p**n #amount of elements, self.size-1 is the cap value of our field
     self.cap = self.size - 1 #max element in field
-    self.expLUT = [-1]*(2*(self.size-1)) #lookup table for exponentiation of an element: expLUT[i] = α^i (we initialize a list of length 2*(self.size-1) to not have "IndexError: list index out of range" troubles in the future)
-    self.logLUT = [-1]*self.size #lookup table for logarithm of an element: logLUT[a^i] = i (defined only for values above 0)
+    if galoisfield_numba is not None: #build the lookup tables with the JIT compiled kernel when Numba is available (the table build is size-1 bit-serial multiplications, which gets noticeable for larger fields)
+      expLUT, logLUT = galoisfield_numba.build_tables(self.size, self.alpha, self.prim_poly)
+      self.expLUT = expLUT.tolist() #lookup table for exponentiation of an element: expLUT[i] = α^i (two identical tables in the same list with offset self.size-1 to avoid having to use modulo in the future)
+      self.logLUT = logLUT.tolist() #lookup table for logarithm of an element: logLUT[a^i] = i (defined only for values above 0)
+    else: #pure Python fallback building the same tables
+      self.expLUT = [-1]*(2*(self.size-1)) #lookup table for exponentiation of an element: expLUT[i] = α^i (we initialize a list of length 2*(self.size-1) to not have "IndexError: list index out of range" troubles in the future)
+      self.logLUT = [-1]*self.size #lookup table for logarithm of an element: logLUT[a^i] = i (defined only for values above 0)
+
+      a = 1
+      for i in range(self.size-1): #we loop self.size-1 times, since we skip log(0) and since there are only self.size-1 different values in expLUT (there are self.size different elements in the field, but α^x; x∈GF(p^n) will never be 0, therefore they start repeating after self.size-1 iterations)
+        if self.logLUT[a] != -1: #if this index has already been visited, we are not guaranteed unique values from α in this field, which is a necessity
+          raise ValueError("the alpha and prim_poly arguments are not compatible")
+        self.expLUT[i] = self.expLUT[i+(self.size-1)] = a #we build two identical tables in the same list with offset self.size-1 to avoid having to use modulo in the future
+        self.logLUT[a] = i
+        a = self.standard_mul(a, self.alpha) #α_i = α_(i-1)*α with α_0 = 1 | (1 -> α -> α^2 -> α^3...)
 
-    a = 1
-    for i in range(self.size-1): #we loop self.size-1 times, since we skip log(0) and since there are only self.size-1 different values in expLUT (there are self.size different elements in the field, but α^x; x∈GF(p^n) will never be 0, therefore they start repeating after self.size-1 iterations)
-      if self.logLUT[a] != -1: #if this index has already been visited, we are not guaranteed unique values from α in this field, which is a necessity
-        raise ValueError("the alpha and prim_poly arguments are not compatible")
-      self.expLUT[i] = self.expLUT[i+(self.size-1)] = a #we build two identical tables in the same list with offset self.size-1 to avoid having to use modulo in the future
-      self.logLUT[a] = i
-      a = self.standard_mul(a, self.alpha) #α_i = α_(i-1)*α with α_0 = 1 | (1 -> α -> α^2 -> α^3...)
+    sentinel = 2*(self.size-1) #guard index placed one past the duplicated exp tables
+    self.logLUT[0] = sentinel #log(0) is undefined, pointing it past every real table entry makes any sum of logs involving a 0 operand land in the zero tail below, so mul needs no zero checks at all
+    self.expLUT.extend([0]*(sentinel+1)) #zero tail covering every index the sentinel can produce (up to logLUT[0] + logLUT[0] = 2*sentinel)
+
+    exp_code, log_code, exp_dtype, log_dtype = ('H', 'h', np.uint16, np.int16) if sentinel <= 32767 else ('I', 'i', np.uint32, np.int32) #the log table must hold the sentinel in its signed type, which 2 bytes only manage up to GF(2^14) - larger fields widen to 4-byte entries instead of overflowing
+    self.expLUT = array.array(exp_code, self.expLUT) #store the finished tables as compact fixed-width arrays instead of lists of boxed Python ints (for the common GF(2^8) the whole table then fits in L1 cache)
+    self.logLUT = array.array(log_code, self.logLUT) #signed, in case callers still index with negative log differences
+    self.exp_np = np.frombuffer(self.expLUT, dtype=exp_dtype) #zero-copy NumPy views of the same buffers, so whole polynomials can be multiplied with a single vectorized table lookup instead of a Python loop
+    self.log_np = np.frombuffer(self.logLUT, dtype=log_dtype) #signed, since the log values of two elements get added together before indexing exp_np
+    self.log_dtype = log_dtype #kept around so the vectorized operations cast their operands with the same width the tables were sized with
+    self.dtype = np.uint8 if self.size <= 256 else np.uint16 if self.size <= 65536 else np.uint32 #smallest NumPy dtype that holds every element of the field, the vectorized operations and the buffers of the layers above allocate with it
+
+    if self.size == 256: #when the elements are exactly bytes, multiplying by a fixed scalar is a byte permutation that bytes.translate performs in one C call
+      prods = self.exp_np[self.log_np[:, None] + self.log_np[None, :]].astype(np.uint8) #full size*size multiplication matrix built with one broadcasted lookup (the log(0) sentinel routes the zero rows/columns into the zero tail)
+      self.mul_tables = [row.tobytes() for row in prods] #mul_tables[a] is the 256-byte translate table of multiplication by a
+    else:
+      self.mul_tables = None #translate tables need exactly 256 entries, larger or smaller fields keep the vectorized lookup path
+
+    if self.prime == 2: #self.prime never changes after construction, so the per-call prime check and attribute loads in the scalar operations can be dropped by binding specialized versions on the instance (instance attributes shadow the class methods)
+      self.add = self.sub = operator.xor #addition and subtraction in GF(2^n) are both XOR
+      expLUT = self.expLUT #captured as closure defaults below, turning the self.expLUT/self.logLUT attribute loads into local variable reads
+      logLUT = self.logLUT
+      def mul(x: int, y: int, expLUT=expLUT, logLUT=logLUT) -> int: #specialized version of the mul method, branchless thanks to the log(0) sentinel and the zero tail of expLUT
+        return expLUT[logLUT[x] + logLUT[y]]
+      def div(x: int, y: int, expLUT=expLUT, logLUT=logLUT, cap=self.cap) -> int: #specialized version of the div method (adding cap keeps the index positive, which the zero tail requires, and does not change the value since the exp table repeats with period cap)
+        if y == 0:
+          raise ZeroDivisionError("cannot divide by zero")
+        return expLUT[cap + logLUT[x] - logLUT[y]] #x = 0 lands in the zero tail and correctly returns 0 without a check
+      self.mul = mul
+      self.div = div
+
+  WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37) #this witness set makes the Miller-Rabin test deterministic for every number below 2^64
 
   @staticmethod
-  def is_prime(x: int) -> bool: #O(sqrt(n)) algorithm for prime checking
+  def is_prime(x: int) -> bool: #deterministic Miller-Rabin, O(log^3 x) instead of the old O(sqrt(x)) trial division
     """
     Return True if input x is a prime number, otherwise False.
     """
     if x < 2: #remove negative numbers, 0 and 1
       return False
-    i = 2 #start at 2, since everything is divisible by 1
-    while i*i <= x: #every non-prime number x has at least 2 divisors (besides 1 and itself), if one is found the number is not prime. Therefore we can simply check up until sqrt(x), since higher than that and the number cannot have 2 divisors
-      if x % i == 0: #check if number is divisor
-        return False #if any divisor is found, the number is not prime
-      i += 1
-    return True #no divisors found
+    for p in GaloisField.WITNESSES: #the witnesses double as a quick small-prime filter, which also handles every x the Miller-Rabin loop below cannot (x smaller than the largest witness)
+      if x == p:
+        return True
+      if x % p == 0: #check if the small prime is a divisor
+        return False
+
+    d = x - 1 #write x-1 as d*2^r with d odd, since x-1 is the exponent Fermat's little theorem works with
+    r = 0
+    while d % 2 == 0:
+      d //= 2
+      r += 1
+    for a in GaloisField.WITNESSES: #if x is composite at least one of these witnesses will expose it
+      w = pow(a, d, x)
+      if w == 1 or w == x-1: #a^d = ±1 means this witness learns nothing, move on to the next one
+        continue
+      for _ in range(r-1): #square up to r-1 times looking for a^(d*2^k) = -1
+        w = pow(w, 2, x)
+        if w == x-1:
+          break
+      else:
+        return False #no square ever hit -1, so a proves x is composite
+    return True #no witness exposed x, for this witness set that guarantees primality
 
   def add(self, x: int, y: int) -> int:
     """
@@ -74,6 +138,9 @@ class GaloisField: #Will represent finite fields (Z/p)[x]/f(x) (polynomials with
     if self.prime != 2:
       raise NotImplementedError(f"stardard_mul multiplication only works in GF(2^n) and not in GF({self.prime}^{self.power})")
 
+    if galoisfield_numba is not None: #run the bit-serial loop in the JIT compiled kernel when Numba is available (this is the only multiplication available without the lookup tables, so it should stay fast for larger fields)
+      return int(galoisfield_numba._standard_mul(x, y, self.size, self.prim_poly))
+
     result = 0
     while y > 0:
       if y & 1: #if y is odd
@@ -88,9 +155,37 @@ class GaloisField: #Will represent finite fields (Z/p)[x]/f(x) (polynomials with
     """
     Return x*y in the Galois Field.
     """
-    if x == 0 or y == 0: #multiplication by 0
-      return 0
-    return self.expLUT[self.logLUT[x] + self.logLUT[y]] #x*y can be written as α^n*α^m = α^(n+m), where n and m are their log values
+    return self.expLUT[self.logLUT[x] + self.logLUT[y]] #x*y can be written as α^n*α^m = α^(n+m), where n and m are their log values. No zero checks are needed: log(0) holds a sentinel pointing any sum involving it into the zero tail of expLUT
+
+  def mul_vec(self, a: int, b: np.ndarray) -> np.ndarray:
+    """
+    Return a*b in the Galois Field for every element of the array 'b' at once.
+
+    The same log/exp table trick as in the mul method, but performed as one vectorized NumPy lookup over the whole array instead of a Python-level loop per element.
+    """
+    b = np.asarray(b, dtype=self.log_dtype) #cast with the width the tables were sized with, a fixed narrow type would wrap the elements of larger fields
+    return self.exp_np[self.log_np[a] + self.log_np[b]].astype(self.dtype) #a*b_i can be written as α^n*α^m = α^(n+m). The log(0) sentinel sends any product with a 0 operand into the zero tail of exp_np, so no where mask is needed
+
+  def mul_vec_arr(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Return a*b in the Galois Field element-wise for two arrays 'a' and 'b' of the same length at once.
+
+    The bulk version of mul_vec for when both operands are whole coefficient arrays, done as one vectorized NumPy lookup.
+    """
+    a = np.asarray(a, dtype=self.log_dtype) #cast with the width the tables were sized with, a fixed narrow type would wrap the elements of larger fields
+    b = np.asarray(b, dtype=self.log_dtype)
+    return self.exp_np[self.log_np[a] + self.log_np[b]].astype(self.dtype) #a_i*b_i can be written as α^n*α^m = α^(n+m). The log(0) sentinel sends any product with a 0 operand into the zero tail of exp_np, so no where mask is needed
+
+  def div_vec(self, a: np.ndarray, b: int) -> np.ndarray:
+    """
+    Return a/b in the Galois Field for every element of the array 'a' at once.
+
+    The same log/exp table trick as in the div method, but performed as one vectorized NumPy lookup over the whole array instead of a Python-level loop per element.
+    """
+    if b == 0: #division by 0
+      raise ZeroDivisionError("cannot divide by zero")
+    a = np.asarray(a, dtype=self.log_dtype) #cast with the width the tables were sized with, a fixed narrow type would wrap the elements of larger fields
+    return self.exp_np[self.cap + self.log_np[a] - self.log_np[b]].astype(self.dtype) #a_i/b can be written as α^n/α^m = α^(n-m). Adding cap keeps the index positive without changing the value (the exp table repeats with period cap), and a 0 dividend lands in the zero tail through the log(0) sentinel
 
   def div(self, x: int, y: int) -> int:
     """
@@ -98,18 +193,20 @@ class GaloisField: #Will represent finite fields (Z/p)[x]/f(x) (polynomials with
     """
     if y == 0: #division by 0
       raise ZeroDivisionError("cannot divide by zero")
-    if x == 0: #zero divided by something
-      return 0
-    return self.expLUT[self.logLUT[x] - self.logLUT[y]] #x/y can be written as α^n/α^m = α^(n-m), where n and m are their log value
+    return self.expLUT[self.cap + self.logLUT[x] - self.logLUT[y]] #x/y can be written as α^n/α^m = α^(n-m), where n and m are their log value. Adding cap keeps the index positive without changing the value (the exp table repeats with period cap), and x = 0 lands in the zero tail through the log(0) sentinel
 
   def pow(self, x: int, p: int) -> int:
     """
     Return x^p in the Galois Field.
     """
+    if x == 0: #the log(0) sentinel cannot be scaled by p, so 0 is handled explicitly (0^0 is taken to be 1)
+      return 0 if p else 1
     return self.expLUT[(self.logLUT[x]*p) % self.cap]
 
   def inverse(self, x: int) -> int:
     """
     Return 1/x in the Galois Field.
     """
-    return self.expLUT[-self.logLUT[x]] #x^(-1) can be written as α^(-n), with n being the log value
\ No newline at end of file
+    if x == 0: #0 has no multiplicative inverse. Without this check the sentinel would produce a negative index that only reaches the zero tail through Python index wraparound
+      raise ZeroDivisionError("cannot divide by zero")
+    return self.expLUT[self.cap - self.logLUT[x]] #x^(-1) can be written as α^(-n) = α^(cap-n), with n being the log value
\ No newline at end of file
@@ -0,0 +1,34 @@
+import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def _standard_mul(x: int, y: int, size: int, prim_poly: int) -> int: #JIT compiled version of GaloisField.standard_mul, only for GF(2^n)
+  """
+  Return x*y in GF(2^n) with field size 'size' and primitive polynomial 'prim_poly' (bit-serial multiplication without lookup tables).
+  """
+  result = 0
+  while y > 0:
+    if y & 1: #if y is odd
+      result ^= x #addition in GF(2^n) is XOR
+    x <<= 1 #same as 2x
+    y >>= 1 #same as y//2 (right shift drops the last bit)
+    if x & size: #same as x > size-1 (size-1 indicates the maximum value that can exist in the field)
+      x ^= prim_poly #if x gets larger than the cap it means the polynomial it represents is degree n or higher and must be reduced by the primitive polynomial
+  return result
+
+@njit(cache=True)
+def build_tables(size: int, alpha: int, prim_poly: int) -> tuple:
+  """
+  Return the exponentiation and logarithm lookup tables (expLUT, logLUT) for GF(2^n) as NumPy arrays (the same loop as in GaloisField.__init__, but compiled so the size-1 bit-serial multiplications run without interpreter overhead).
+  """
+  expLUT = np.full(2*(size-1), -1, dtype=np.int32) #lookup table for exponentiation of an element: expLUT[i] = α^i (two identical tables in the same array with offset size-1 to avoid having to use modulo in the future). int32 holds the elements of any GF(2^n) up to n = 30, narrower types would silently wrap for fields above GF(2^14)
+  logLUT = np.full(size, -1, dtype=np.int32) #lookup table for logarithm of an element: logLUT[a^i] = i (defined only for values above 0)
+
+  a = 1
+  for i in range(size-1): #we loop size-1 times, since we skip log(0) and since there are only size-1 different values in expLUT
+    if logLUT[a] != -1: #if this index has already been visited, we are not guaranteed unique values from α in this field, which is a necessity
+      raise ValueError("the alpha and prim_poly arguments are not compatible")
+    expLUT[i] = expLUT[i+(size-1)] = a
+    logLUT[a] = i
+    a = _standard_mul(a, alpha, size, prim_poly) #α_i = α_(i-1)*α with α_0 = 1 | (1 -> α -> α^2 -> α^3...)
+  return expLUT, logLUT
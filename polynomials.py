@@ -1,5 +1,12 @@
 from typing import Iterable, Tuple
 
+import numpy as np
+
+try: #Numba is an optional dependency, the JIT compiled kernels are used when available and everything falls back to pure Python otherwise
+  import polynomials_numba
+except ImportError:
+  polynomials_numba = None
+
 class Polynomials:
   """
   Holder class for operations on polynomials inside Galois Field.
@@ -10,6 +17,23 @@ class Polynomials:
     self.field = field #the Galois Field from which the coefficients are taken from
     self.cap = field.size - 1 #cap value od coefficients
 
+  def _check(self, p: Iterable[int]) -> np.ndarray:
+    """
+    Return the given polynomial as an array of the field's element dtype after validating that every coefficient fits the characteristics of the field (the check runs as one vectorized comparison instead of a per-coefficient Python loop).
+    """
+    arr = np.asarray(p, dtype=np.int64) #int64 so even far out of range values survive the conversion and get caught below instead of overflowing the staging cast
+    if ((arr < 0) | (arr > self.cap)).any(): #input must be constrained by Galois Field, most likely 0-255
+      raise ValueError("coefficients of given polynomials do not fit the charachteristics of the field")
+    return arr.astype(self.field.dtype) #the field knows the smallest dtype that holds its elements, a hardcoded uint8 would truncate the coefficients of fields above GF(2^8)
+
+  @staticmethod
+  def _shorten_arr(p: np.ndarray) -> np.ndarray:
+    """
+    Array version of the shorten method: return a view of the polynomial 'p' without the leading 0 coefficients (O(1) slicing instead of list copies, at least the last coefficient always remains).
+    """
+    nonzero = np.nonzero(p)[0]
+    return p[nonzero[0]:] if len(nonzero) else p[-1:] #when every coefficient is 0 the polynomial shortens to just the constant
+
   def shorten(self, p: Iterable[int]) -> list[int]:
     """
     Return a polynomial in list form (coefficients arranged from highest term to lowest) without the leading 0 coefficients.
@@ -28,82 +52,136 @@ class Polynomials:
     if not len(p): #preventing IndexError
       raise ValueError("empty polynomial")
 
-    res = p[0] #first coefficient
-    for i in range(1, len(p)): #loop degree p times
-      res = self.field.add(self.field.mul(res, x), p[i]) #each loop multiply by x and add next coefficient
-    return res
+    p_arr = np.asarray(p, dtype=self.field.dtype)
+    if x == 0: #0 raised to any positive power is 0, so only the constant term survives
+      return int(p_arr[-1])
+
+    lx = self.field.logLUT[x]
+    degs = np.arange(len(p_arr)-1, -1, -1, dtype=np.int32) #degree of each term (coefficients are arranged from highest term to lowest)
+    xpows = self.field.exp_np[(lx*degs) % self.field.cap] #x^deg for every term at once: x^deg = α^(log(x)*deg), computed as one vectorized table lookup
+    return int(np.bitwise_xor.reduce(self.field.mul_vec_arr(p_arr, xpows))) #sum (XOR) of coefficient times power over all terms, instead of a Python-level Horner loop
 
   def add(self, p: Iterable[int], q: Iterable[int]) -> list[int]:
     """
     Return a polynomial in list form (coefficients arranged from highest term to lowest) resulting from addition of 'p' with 'q'.
     """
-    for i in p: #input must be constrained by Galois Field, most likely 0-255
-      if i > self.cap or i < 0:
-        raise ValueError("coefficients of given polynomials do not fit the charachteristics of the field")
-    for i in q:
-      if i > self.cap or i < 0:
-        raise ValueError("coefficients of given polynomials do not fit the charachteristics of the field")
-
-    res = [0] * max(len(p), len(q)) #degree of new polynomial <= max(degree p, degree q)
-    for i in range(len(p)):
-      res[len(res) - len(p) + i] = p[i] #set coefficients of new polynomial as coefficients of polynomial p
-    for i in range(len(q)):
-      res[len(res) - len(q) + i] = self.field.add(res[len(res) - len(q) + i], q[i]) #add coefficients of new polynomial and coefficients of polynomial q
+    self._check(p) #input must be constrained by Galois Field, most likely 0-255
+    self._check(q)
+
+    _add = self.field.add #hoisted to a local along with the lengths, so the loops below skip the repeated attribute lookups and len calls
+    len_p, len_q = len(p), len(q)
+    res = [0] * max(len_p, len_q) #degree of new polynomial <= max(degree p, degree q)
+    off_p, off_q = len(res) - len_p, len(res) - len_q #offsets aligning p and q to the lowest term of the new polynomial
+    for i in range(len_p):
+      res[off_p + i] = p[i] #set coefficients of new polynomial as coefficients of polynomial p
+    for i in range(len_q):
+      res[off_q + i] = _add(res[off_q + i], q[i]) #add coefficients of new polynomial and coefficients of polynomial q
     return res
 
   def mul(self, p: Iterable[int], q: Iterable[int]) -> list[int]:
     """
     Return a polynomial in list form (coefficients arranged from highest term to lowest) resulting from multiplication of 'p' with 'q'.
     """
-    for i in p: #input must be constrained by Galois Field, most likely 0-255
-      if i > self.cap or i < 0:
-        raise ValueError("coefficients of given polynomials do not fit the charachteristics of the field")
-    for i in q:
-      if i > self.cap or i < 0:
-        raise ValueError("coefficients of given polynomials do not fit the charachteristics of the field")
-
-    res = [0] * (len(p) + len(q) - 1) #degree of new polynomial is degree p plus degree q
-    for i in range(len(p)): #multiply every coefficient of p with every coefficient of q
-      for j in range(len(q)):
-        prod = self.field.mul(p[i], q[j]) #product of coefficient in Galois Field
-        res[i + j] = self.field.add(res[i + j], prod) #add the product to the currect coefficient values based on degree
-    return res
+    p_arr = self._check(p) #input must be constrained by Galois Field, most likely 0-255
+    q_arr = self._check(q) #q is converted once so every row of the multiplication happens as a single vectorized operation
+
+    if self.field.mul_tables is not None and (len(p_arr) == 1 or len(q_arr) == 1): #a length-1 operand makes the whole product one scalar multiply, which runs as a single C-level byte permutation over GF(2^8)
+      x, vec = (int(p_arr[0]), q_arr) if len(p_arr) == 1 else (int(q_arr[0]), p_arr)
+      return list(vec.tobytes().translate(self.field.mul_tables[x]))
+
+    _mul_vec = self.field.mul_vec #hoisted to a local along with the length of q, so the loop below skips the repeated attribute lookups and len calls
+    len_q = len(q_arr)
+    res = np.zeros(len(p_arr) + len_q - 1, dtype=self.field.dtype) #degree of new polynomial is degree p plus degree q
+    for i in range(len(p_arr)): #multiply every coefficient of p with the whole of q at once
+      res[i:i + len_q] ^= _mul_vec(p_arr[i], q_arr) #product of coefficient with q in Galois Field added (XOR) to the current coefficient values based on degree
+    return res.tolist()
+
+  def _truncated_mul(self, p: Iterable[int], q: Iterable[int], n: int) -> list[int]:
+    """
+    Return a polynomial in list form (coefficients arranged from highest term to lowest) holding only the lowest 'n' coefficients of the product of 'p' with 'q' (the product modulo x^n).
+
+    Fused version of mul followed by taking the monic_div remainder by x^n: the coefficients of degree n and above are never materialized instead of being computed and then divided away.
+    """
+    p_arr = self._check(p)[::-1] #input must be constrained by Galois Field, most likely 0-255. Reversed to lowest term first, so truncating at degree n becomes a plain slice bound
+    q_arr = self._check(q)[::-1]
+
+    m = min(n, len(p_arr) + len(q_arr) - 1) #the product may not even reach degree n, then the whole product survives the truncation
+    if m <= 0:
+      return [0] #everything is divisible by x^0 = 1, so the remainder is just 0
+    res = np.zeros(m, dtype=self.field.dtype)
+    _mul_vec = self.field.mul_vec #hoisted to a local, so the loop below skips the repeated attribute lookups
+    for i in range(min(len(p_arr), m)): #coefficients of p at degree m or higher only contribute to the truncated part
+      res[i:i + len(q_arr)] ^= _mul_vec(p_arr[i], q_arr[:m - i]) #product of coefficient with q clipped at degree m, added (XOR) to the current coefficient values based on degree
+    return self._shorten_arr(res[::-1]).tolist()
+
+  def mul_by_linear(self, p: Iterable[int], c: int) -> list[int]:
+    """
+    Return a polynomial in list form (coefficients arranged from highest term to lowest) resulting from multiplication of 'p' with the monic linear polynomial [1, c] (meaning x + c).
+
+    Specialized single-pass version of the mul method for the degree-1 factors used when building generator and error locator polynomials: p*(x + c) is just p shifted up one degree plus c*p.
+    """
+    p_arr = self._check(p) #input must be constrained by Galois Field, most likely 0-255
+    if c > self.cap or c < 0:
+      raise ValueError("given scalar does not fit the charachteristics of the field")
+
+    zero = np.zeros(1, dtype=self.field.dtype)
+    return (np.concatenate((p_arr, zero)) ^ np.concatenate((zero, self.field.mul_vec(c, p_arr)))).tolist() #p*x (shift up) plus c*p (vectorized multiply)
+
+  def product_tree(self, factors: list[list[int]]) -> list[int]:
+    """
+    Return a polynomial in list form (coefficients arranged from highest term to lowest) resulting from multiplying all the given polynomials 'factors' together.
+
+    The factors are multiplied pairwise level by level (a balanced product tree) instead of as one long chain, which keeps the operands of each multiplication as short as possible and lets every level run through the vectorized mul method.
+    """
+    if not len(factors):
+      return [1] #an empty product is the constant 1
+
+    level = list(factors)
+    while len(level) > 1:
+      next_level = [self.mul(level[i], level[i+1]) for i in range(0, len(level)-1, 2)] #multiply neighbouring factors together
+      if len(level) % 2: #odd amount of factors, the last one carries over to the next level unchanged
+        next_level.append(level[-1])
+      level = next_level
+    return list(level[0])
 
   def scalar(self, p: Iterable[int], x: int) -> list[int]:
     """
     Return a polynomial in list form (coefficients arranged from highest term to lowest) resulting from multiplying the polynomial 'p' with a scalar 'x'.
     """
-    for i in p: #input must be constrained by Galois Field, most likely 0-255
-      if i > self.cap or i < 0:
-        raise ValueError("coefficients of given polynomials do not fit the charachteristics of the field")
+    p_arr = self._check(p) #input must be constrained by Galois Field, most likely 0-255
     if x > self.cap or x < 0:
       raise ValueError("given scalar does not fit the charachteristics of the field")
 
-    return [self.field.mul(x, coeff) for coeff in p]
+    if self.field.mul_tables is not None: #over GF(2^8) the scalar multiply is one C-level byte permutation
+      return list(p_arr.tobytes().translate(self.field.mul_tables[x]))
+    return self.field.mul_vec(x, p_arr).tolist() #one vectorized table lookup instead of a per-coefficient Python loop
 
   def monic_div(self, p: Iterable[int], q: Iterable[int]) -> Tuple[list[int], list[int]]: #expanded syntetic division with monic polynomials (expanded Horner's method) - https://en.wikipedia.org/wiki/Synthetic_division#Expanded_synthetic_division
     """
     Return a tuple of polynomials in list form (coefficients arranged from highest term to lowest), the result and remainder, resulting from division of 'p' with a monic polynomial 'q'.
     """
-    for i in p: #input must be constrained by Galois Field, most likely 0-255
-      if i > self.cap or i < 0:
-        raise ValueError("coefficients of given polynomials do not fit the charachteristics of the field")
-    for i in q:
-      if i > self.cap or i < 0:
-        raise ValueError("coefficients of given polynomials do not fit the charachteristics of the field")
+    p_arr = self._check(p) #input must be constrained by Galois Field, most likely 0-255
+    q_arr = self._check(q)
 
-    if len(q) and q[0] != 1: #function only works with monic divisors (highest term coefficient must be 1)
+    if len(q_arr) and q_arr[0] != 1: #function only works with monic divisors (highest term coefficient must be 1)
       raise ValueError("given divisor is not monic")
 
-    if q == [1]:
-      return p, [0] #everything is divisible by 1, but it breaks this algorithm
-
-    res = p.copy()
-    for i in range(len(p) - (len(q) - 1)): #expanded syntetic division has (degree p - (degree q - 1)) steps, since (degree q - 1) is the maximum degree of the remainder. The coefficients of higher degree parts can always be removed via division
-      for j in range(1, len(q)): #skip first coefficient as the divisor is assumed to always be monic (first coefficient is always 1)
-        res[i + j] = self.field.sub(res[i + j], self.field.mul(q[j], res[i])) #add negated j-th coefficient of q multiplied by i-th coeffcient of res to positions right of i
-
-    separation = len(q) - 1 #separator for quotient and remainder using extended Horner's method
-    quotient = self.shorten(res[:-separation]) if len(p) >= len(q) else [0]
-    remainder = self.shorten(res[-separation:])
+    if len(q_arr) == 1 and q_arr[0] == 1:
+      return list(p), [0] #everything is divisible by 1, but it breaks this algorithm
+
+    if polynomials_numba is not None: #run the division loop in the JIT compiled kernel when Numba is available
+      res = polynomials_numba.monic_div(p_arr, q_arr, self.field.exp_np, self.field.log_np)
+    else: #NumPy fallback doing the same expanded synthetic division with one vectorized multiply per outer step
+      res_arr = p_arr.copy()
+      q_tail = q_arr[1:] #skip first coefficient as the divisor is assumed to always be monic (first coefficient is always 1)
+      _mul_vec = self.field.mul_vec #hoisted to a local along with the length of q, so the loop below skips the repeated attribute lookups and len calls
+      len_q = len(q_arr)
+      for i in range(len(p_arr) - (len_q - 1)): #expanded syntetic division has (degree p - (degree q - 1)) steps, since (degree q - 1) is the maximum degree of the remainder. The coefficients of higher degree parts can always be removed via division
+        if res_arr[i]: #multiplying by 0 would contribute nothing to the coefficients right of i
+          res_arr[i+1:i+len_q] ^= _mul_vec(int(res_arr[i]), q_tail) #subtract (XOR) the whole tail of q multiplied by the i-th coefficient from positions right of i in one vectorized operation
+      res = res_arr
+
+    separation = len(q_arr) - 1 #separator for quotient and remainder using extended Horner's method (slicing an array only creates views, so no copies are made until the final conversion back to lists)
+    quotient = self._shorten_arr(res[:-separation]).tolist() if len(p_arr) >= len(q_arr) else [0]
+    remainder = self._shorten_arr(res[-separation:]).tolist()
     return quotient, remainder
\ No newline at end of file
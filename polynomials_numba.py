@@ -0,0 +1,14 @@
+import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def monic_div(p: np.ndarray, q: np.ndarray, expLUT: np.ndarray, logLUT: np.ndarray) -> np.ndarray: #JIT compiled inner loop of Polynomials.monic_div
+  """
+  Return the expanded synthetic division buffer for 'p' divided by the monic polynomial 'q' (quotient and remainder still joined, the caller splits them). The multiplication inside the loop is done inline with the provided exp/log lookup tables.
+  """
+  res = p.copy()
+  for i in range(len(p) - (len(q) - 1)): #expanded syntetic division has (degree p - (degree q - 1)) steps, since (degree q - 1) is the maximum degree of the remainder
+    li = logLUT[res[i]] #log of the current coefficient is reused across the whole inner loop
+    for j in range(1, len(q)): #skip first coefficient as the divisor is assumed to always be monic (first coefficient is always 1)
+      res[i + j] ^= expLUT[li + logLUT[q[j]]] #subtract (XOR) q[j]*res[i] from positions right of i. No zero checks are needed: the log(0) sentinel sends any product with a 0 operand into the zero tail of expLUT
+  return res
@@ -1,7 +1,17 @@
 from typing import Iterable, Union
+
+import numpy as np
+
 from galoisfield import GaloisField
 from polynomials import Polynomials
 
+try: #Numba is an optional dependency, the JIT compiled kernels are used when available and everything falls back to pure Python otherwise
+  import reedsolomon_numba
+except ImportError:
+  reedsolomon_numba = None
+
+_GEN_CACHE: dict[tuple[int, int, int, int], list[int]] = {} #module level memo of generator polynomial prefixes shared by every codec, keyed by (field power, alpha, prim_poly, parity bit amount). The generators form a chain (gen_i = gen_(i-1)*(x - α^i)), so a codec only has to multiply forward from the largest cached prefix instead of rebuilding from scratch - sweeping enc_len over many codecs then costs O(new factors) per codec
+
 class ReedSolomonCodec:
   """
   Create a Reed-Solomon code codec with a specified length of parity bits and Galois Field. When specifying a Galois Field the parameter 'n' creates a field GF(2^n), the parameters 'alpha' and 'prim_poly' written as a polynomials when in binary form (the number 11 or 1011 in binary refers to the polynomial [x^3 + x + 1]) change the characteristics of the field.
@@ -14,26 +24,72 @@ class ReedSolomonCodec:
     self.enc_len = enc_len
 
     self.field = GaloisField(2, n, alpha, prim_poly) #field in which the encoding will take place
+    if not 0 <= self.enc_len < self.field.cap: #every codeword needs room for at least one message byte next to the parity bits, a degenerate amount must fail here instead of hanging or crashing deep inside encode
+      raise ValueError(f"amount of parity bits must be between 0 and {self.field.cap - 1} for this field")
     self.polynomials = Polynomials(self.field) #holder class for operations with polynomials inside a Galois Field
 
+    self.alpha_pow = self.field.expLUT #α^i is expLUT[i] by construction, so the exp table doubles as a precomputed power table for every α^i lookup in the codec (the duplicated upper half even covers exponents up to twice the field cap)
+
+    self.gen = np.asarray(self._build_generator_poly(), dtype=self.field.dtype) #the generator polynomial only depends on values fixed at construction, so it is computed once here and reused by every encode call instead of being rebuilt per codeword
+
+    self.gen_mul = self.field.exp_np[self.field.log_np[self.gen[1:]][:, None] + self.field.log_np[np.arange(self.field.size)][None, :]].astype(self.field.dtype) #gen_mul[j, v] = gen_tail[j]*v, the full multiplication table of the generator tail (one row of field.size products per tail coefficient) built with one broadcasted lookup. The encoder inner loop then multiplies with a single indexed load instead of going through the exp/log tables
+
+    self._chunk_len = self.field.cap - self.enc_len #amount of message bytes per codeword slice, fixed at construction so encode calls do not recompute it
+
+  def _as_arr(self, msg: Union[Iterable[int], str, bytes]) -> np.ndarray:
+    """
+    Return the given message as a validated array of the field's element dtype. Accepts str (converted through the character codes), bytes and any iterable of ints, so every public entry point materializes its input exactly once - a generator passed in is consumed here instead of being silently exhausted by repeated iteration further down.
+    """
+    if isinstance(msg, str): #over GF(2^8) the coefficients are exactly the latin-1 code points, so the str converts with one C-level encode instead of a per-character ord loop
+      msg = msg.encode("latin-1") if self.field.size == 256 else [ord(ch) for ch in msg]
+    if isinstance(msg, (bytes, bytearray)):
+      msg = np.frombuffer(msg, dtype=np.uint8) if self.field.size == 256 else list(msg) #the zero-copy view reads 1-byte symbols, which only line up with the elements of GF(2^8) - other fields take the byte values as plain ints and let the range check judge them
+    elif not isinstance(msg, (list, tuple, np.ndarray)):
+      msg = list(msg) #a plain iterator only supports a single pass, so it is materialized here
+    return self.polynomials._check(msg) #input must be constrained by Galois Field, most likely 0-255
+
+  def _build_generator_poly(self) -> list[int]:
+    """
+    Build the generator polynomial in list form (coefficients arranged from highest term to lowest), only meant to be called once at initialization (use the generator_poly method or the 'gen' attribute afterwards).
+    """
+    field_key = (self.field.power, self.field.alpha, self.field.prim_poly)
+    gen, start = [1], 0 #initial polynomial is just a constant (1) in case enc_len is equal to 0. gen_0 = 1
+    for k in range(self.enc_len, 0, -1): #resume from the largest cached prefix that does not overshoot the wanted degree
+      if field_key + (k,) in _GEN_CACHE:
+        gen, start = list(_GEN_CACHE[field_key + (k,)]), k
+        break
+
+    _mul_by_linear, _alpha_pow = self.polynomials.mul_by_linear, self.alpha_pow #hoisted to locals, so the loop below skips the repeated attribute lookups
+    for i in range(start, self.enc_len):
+      gen = _mul_by_linear(gen, _alpha_pow[i]) #gen_i = gen_(i-1) * (x - α^i) (for example: gen_4 = (x - 1)(x - α)(x - α^2)(x - α^3)). Negation in GF(2^n) is the identity, so the root is a single table read
+      _GEN_CACHE[field_key + (i+1,)] = list(gen) #every intermediate is cached too, so later codecs with any enc_len up to this one get a full cache hit
+    return gen
+
   def generator_poly(self) -> list[int]:
     """
     Return the generator polynomial in list form (coefficients arranged from highest term to lowest) based on the amount of parity bits (parity bit amount is specified at initialization).
 
     A codec with parity bit amount n will have a generator polynomial of degree n (length of list will be n+1, since we also have the constant at the end).
     """
-    gen = [1] #initial polynomial is just a constant (1) in case enc_len is equal to 0. gen_0 = 1
-    for i in range(self.enc_len):
-      gen = self.polynomials.mul(gen, [1, self.field.sub(0, self.field.pow(self.field.alpha, i))]) #gen_i = gen_(i-1) * (x - α^i) (for example: gen_4 = (x - 1)(x - α)(x - α^2)(x - α^3))
-    return gen
+    return self.gen.tolist() #the polynomial is precomputed at initialization, so only a list copy is handed out
 
-  def syndromes_poly(self, msg: Iterable[int]) -> list[int]:
+  def syndromes_poly(self, msg: Union[Iterable[int], str, bytes]) -> list[int]:
     """
     Return the syndromes polynomial in list form (coefficients arranged from highest term to lowest) based on the inputted message and amount of parity bits (parity bit amount is specified at initialization).
 
     If the inputted message is without errors, the returned polynomial will have all coefficients equal to 0.
     """
-    return [self.polynomials.eval(msg, self.field.pow(self.field.alpha, i)) for i in range(self.enc_len)][::-1] #evaluating the message with values used to create the generator polynomial, therefore if the recieved message is correct all coefficients should equal 0 (since a message without errors is just res(x)*gen(x))
+    msg_arr = self._as_arr(msg) #input materialized and validated once at the boundary
+    if not len(msg_arr): #preventing operations on an empty message
+      raise ValueError("empty polynomial")
+
+    if reedsolomon_numba is not None and self.field.size == 256: #run the batched Horner pass in the JIT compiled kernel when Numba is available (reads the message once for all enc_len syndromes). The kernel accumulates in uint8, so larger fields take the vectorized path below instead of wrapping silently
+      return reedsolomon_numba.syndromes_poly(msg_arr, self.enc_len, self.field.exp_np, self.field.log_np).tolist()[::-1]
+
+    degs = np.arange(len(msg_arr)-1, -1, -1, dtype=np.int64) #degree of each term (coefficients are arranged from highest term to lowest)
+    exps = (np.arange(self.enc_len, dtype=np.int64)[:, None]*degs[None, :]) % self.field.cap #syndrome i is the message evaluated at α^i, so the term at degree d contributes coefficient*α^(i*d). This matrix holds the exponent i*d for every (i, d) pair at once
+    prod = self.field.exp_np[exps + self.field.log_np[msg_arr]] #coefficient*α^(i*d) for the whole matrix in one vectorized lookup (the exponent matrix already holds the logs of the powers, so only the coefficient logs get added). The log(0) sentinel sends the terms with a 0 coefficient into the zero tail of exp_np, so no where mask is needed
+    return np.bitwise_xor.reduce(prod, axis=1).tolist()[::-1] #sum (XOR) each row into a syndrome. If the recieved message is correct all syndromes should equal 0 (since a message without errors is just res(x)*gen(x))
 
   def sigma(self, pos: Iterable[int]) -> list[int]:
     """
@@ -41,16 +97,15 @@ class ReedSolomonCodec:
 
     Note: The positions inputted follow a reversed 0-index notation (the last element is at position 0 and the first is the highest position in the message).
     """
-    sigma = [1] #initializing the sigma polynomial
-    for i in pos:
-      sigma = self.polynomials.mul(sigma, self.polynomials.add([1], [self.field.pow(self.field.alpha, i), 0])) #formula for the sigma polynomial is as follows: sigma = sigma*(1 - alpha^i*x) for i in pos
-    return sigma
+    _alpha_pow = self.alpha_pow #hoisted to a local, so the comprehension below skips the repeated attribute lookups
+    factors = [[_alpha_pow[i], 1] for i in pos] #formula for the sigma polynomial is as follows: sigma = sigma*(1 - alpha^i*x) for i in pos, so every position contributes one linear factor (written out directly instead of going through the general polynomial addition: (1 - α^i*x) is just the two coefficients [α^i, 1])
+    return self.polynomials.product_tree(factors) #multiplying the factors as a balanced tree keeps the operands short instead of dragging the full-degree sigma through every multiplication
 
   def omega(self, syndromes: Iterable[int], sigma: Iterable[int]) -> list[int]:
     """
     Return omega(x), a polynomial in list form (coefficients arranged from highest term to lowest) known as the error evaluator polynomial. It is calculated based on the syndromes polynomial, sigma(x) and amount of parity bits (parity bit amount is specified at initialization).
     """
-    return self.polynomials.monic_div(self.polynomials.mul(syndromes, sigma), [1] + [0]*self.enc_len)[1] #omega(x) = (syndromes(x)*sigma(x)) mod x^(enc_len+1)
+    return self.polynomials._truncated_mul(syndromes, sigma, self.enc_len) #omega(x) = (syndromes(x)*sigma(x)) mod x^enc_len, built as one truncated product so the high-degree part that the division used to throw away is never computed at all
 
   def __single_encode(self, msg: Iterable[int]) -> Iterable[int]:
     """
@@ -61,55 +116,108 @@ class ReedSolomonCodec:
     if len(msg) + self.enc_len > self.field.cap: #encoded message must be smaller than the cap
       raise ValueError(f"given message is too long to encode, cap is {self.field.cap}")
 
-    padded = msg + [0]*self.enc_len #pad the message to make room for remainder of polynomial division of msg with generator
-    remainder = self.polynomials.monic_div(padded, self.generator_poly())[1] #only interested in the remainder as that is the encoding
+    if not self.enc_len: #no parity bits, the remainder of dividing by gen = [1] is just the zero polynomial
+      return msg + [0]
+
+    msg_arr = self.polynomials._check(msg) #input must be constrained by Galois Field, most likely 0-255 (monic_div did this validation before)
+    rem = np.zeros(self.enc_len, dtype=self.field.dtype) #running remainder buffer of the systematic shift register (LFSR) encoder - only the remainder is ever materialized, the quotient that monic_div used to build alongside it is never needed. The JIT kernel specializes on whatever dtype this buffer carries, so wide fields encode correctly too
+    if reedsolomon_numba is not None: #run the shift register in the JIT compiled kernel when Numba is available, using the precomputed generator multiplication table
+      reedsolomon_numba.encode_lfsr(msg_arr, self.gen_mul, rem)
+    else: #pure Python fallback doing the same shift register, with every GF multiply replaced by one load from the precomputed generator multiplication table
+      gen_mul_T = self.gen_mul.T #transposed so one indexed load hands out the whole gen_tail*factor vector, skipping the exp/log lookups of mul_vec entirely
+      for c in msg: #feed the message through the shift register one byte at a time
+        factor = c ^ int(rem[0]) #the leading remainder byte combines with the incoming byte to give the feedback factor
+        rem[:-1] = rem[1:] #shift the register up one position
+        rem[-1] = 0
+        rem ^= gen_mul_T[factor] #accumulate the feedback times the generator tail straight out of the table
+    remainder = self.polynomials.shorten(rem.tolist()) #monic_div handed the remainder through shorten, matching that keeps the encoded output identical
     return msg + remainder #returning encoded message equal to res(x)*gen(x) in GF(2^n), where res(x) and gen(x) are polynomials for the result of division with generator and the generator polynomial itself
 
-  def encode(self, msg: Union[Iterable[int], str], return_str: bool=False) -> Union[Iterable[int], str]:
+  def encode(self, msg: Union[Iterable[int], str, bytes], return_str: bool=False) -> Union[Iterable[int], str]:
     """
     Return a polynomial in list form (coefficients arranged from highest term to lowest) representing the encoded message without any errors.
 
     By setting the 'return_str' flag to True, the returned message will not be in polynomial form, but rather a string with the coefficients replaced by ASCII characters.
     """
-    encoded = []
-    slicing_idx = list(range(0, len(msg), (self.field.cap - self.enc_len))) + [len(msg)] #indexes used for slicing the message to correct lengths
+    msg_arr = self._as_arr(msg) #input materialized and validated once at the boundary, so str, bytes, lists and generators all behave the same further down
+    chunk_len = self._chunk_len #precomputed at initialization
+    if reedsolomon_numba is not None and self.enc_len and len(msg_arr): #batch path: encode every slice through one call of the JIT compiled kernel, the rows are independent codewords sharing the same generator table
+      vals = msg_arr.tolist() #the stitched output below is built from plain Python ints (slices are at most chunk_len long, so the per-slice length check of __single_encode always passes)
+      n_slices = (len(msg_arr) + chunk_len - 1) // chunk_len
+      msgs = np.zeros((n_slices, chunk_len), dtype=self.field.dtype) #the JIT kernel specializes on the element dtype of these buffers, so wide fields batch-encode correctly too
+      msgs[:-1] = msg_arr[:(n_slices-1)*chunk_len].reshape(n_slices-1, chunk_len) #all full slices reshape directly into rows
+      msgs[-1, chunk_len - (len(msg_arr) - (n_slices-1)*chunk_len):] = msg_arr[(n_slices-1)*chunk_len:] #the last partial slice is padded with leading zeros, which contribute nothing to the division remainder
+
+      rems = np.zeros((n_slices, self.enc_len), dtype=self.field.dtype)
+      reedsolomon_numba.encode_lfsr_batch(msgs, self.gen_mul, rems)
 
-    for i, j in zip(slicing_idx[:-1], slicing_idx[1:]): #iterate through pairs of values of slicing_idx with one shift (f.e. [(0, 1), (1, 2), (2, 3), (3, None)])
-      slice = [ord(ch) for ch in msg[i:j]] if isinstance(msg, str) else msg[i:j] #change from str to polynomial for each slice
-      encoded += self.__single_encode(slice)
-    return "".join([chr(i) for i in encoded]) if return_str else encoded
+      encoded = bytearray() if self.field.size == 256 else [] #over GF(2^8) the output accumulates in a bytearray: the extends below append raw bytes at C level instead of growing a list of boxed Python ints
+      for r in range(n_slices): #stitch every original (unpadded) slice back together with its remainder
+        encoded.extend(vals[r*chunk_len:(r+1)*chunk_len] + self.polynomials.shorten(rems[r].tolist())) #extend accepts any iterable of ints, so the same call feeds the bytearray and the plain list variant
+    else: #fallback encoding the slices one by one
+      encoded = bytearray() if self.field.size == 256 else []
+      i = 0
+      while i < len(msg_arr): #walk the slice boundaries with plain integer arithmetic instead of materializing the whole index list up front
+        j = min(i + chunk_len, len(msg_arr))
+        encoded.extend(self.__single_encode(msg_arr[i:j].tolist())) #extend accepts any iterable of ints, so the same call feeds the bytearray and the plain list variant
+        i = j
+    if return_str:
+      return bytes(encoded).decode("latin-1") if self.field.size == 256 else "".join([chr(i) for i in encoded]) #the reverse of the conversion above: one C-level decode builds the whole string over GF(2^8), larger fields keep the per-character join
+    return list(encoded) if isinstance(encoded, bytearray) else encoded #callers still get the usual list of ints back
 
-  def error_poly(self, msg: Iterable[int], pos: Iterable[int]) -> list[int]: #Forney algorithm - https://en.wikipedia.org/wiki/Forney_algorithm
+  def error_poly(self, msg: Union[Iterable[int], str, bytes], pos: Iterable[int]) -> list[int]: #Forney algorithm - https://en.wikipedia.org/wiki/Forney_algorithm
     """
     Return a polynomial in list form (coefficients arranged from highest term to lowest) containing the error factors at each term calculated with the usage of the recieved message and the positions of errors in the message via the Forney algorithm.
     
     When subtracted from the recieved message, the original message is recovered.
     """
-    reversed_pos = [(len(msg)-1)-i for i in pos] #error positions must be reversed so that they match the degree of the term
+    msg_arr = self._as_arr(msg) #input materialized and validated once at the boundary
+    if not len(pos): #no positions means nothing to correct, so the syndromes do not even have to be computed
+      return [0]*len(msg_arr)
+
+    syndromes = self.syndromes_poly(msg_arr)
+    if not any(syndromes): #all syndromes being 0 means the message is without errors, so no corrections are needed and none of the sigma/omega work below has to run (the common case when decoding mostly clean streams)
+      return [0]*len(msg_arr)
+
+    if len(pos) == 1: #a single erasure collapses the whole Forney formula: with one error e at degree d the syndrome S_0 is e*(α^0)^d = e, so the magnitude is read straight off the syndromes without any sigma/omega work
+      error_poly = [0]*len(msg_arr)
+      error_poly[pos[0]] = syndromes[-1] #the syndromes are arranged from highest to lowest, so S_0 sits at the end
+      return error_poly
+
+    reversed_pos = [(len(msg_arr)-1)-i for i in pos] #error positions must be reversed so that they match the degree of the term
     sigma = self.sigma(reversed_pos)
-    if sigma.count(0) == len(sigma): #if message is without errors return polynomial with error factors 0
-      return [0]*len(msg)
-    omega = self.omega(self.syndromes_poly(msg), sigma)
+    omega = self.omega(syndromes, sigma) #the syndromes computed for the zero check above are reused instead of being recomputed
 
-    roots = []
-    for i in reversed_pos:
-      roots.append(self.field.inverse(self.field.pow(self.field.alpha, self.field.cap - i))) #α^(-(cap - i)) is the same as α^i, but it better describes what is going on. We are looking for the inverse of α raised to the position in the message
+    pos_arr = np.asarray(reversed_pos, dtype=np.intp)
+    roots = self.field.exp_np[pos_arr % self.field.cap].astype(self.field.dtype) #the root for position i is α^(-(cap - i)), which is the same as α^i. We are looking for α raised to the position in the message, pulled straight out of the exp table for every position at once
+    roots_inverse = self.field.exp_np[self.field.cap - pos_arr % self.field.cap].astype(self.field.dtype) #the Forney formula evaluates at the inverses X^(-1) = α^(cap - i), again one vectorized table lookup
 
-    error_poly = [0]*len(msg)
-    for i in range(len(roots)):
-      X = roots[i]
-      X_inverse = self.field.inverse(X)
-      
-      denominator = list(sigma) #copy of sigma(x)
-      denominator = [coef if i%2 != 0 else 0 for i, coef in enumerate(sigma[::-1])][::-1]
-      denominator = self.polynomials.eval(self.polynomials.monic_div(denominator, [1, 0])[0], X_inverse)
+    sigma_arr = np.asarray(sigma, dtype=self.field.dtype)
+    deriv = np.zeros(len(sigma_arr), dtype=self.field.dtype)
+    deriv[len(sigma_arr)%2::2] = sigma_arr[len(sigma_arr)%2::2] #formal derivative sigma'(x): in characteristic 2 only the odd-degree terms survive differentiation (d(x^k) = k*x^(k-1) and even k means multiplying by 0). Index k holds the coefficient of degree len-1-k, so the odd degrees sit on every second index starting at len%2 - one strided copy keeps them and leaves the rest 0, with no reversals
+    sigma_deriv = deriv[:-1] #dividing the survivors by x is exact (the constant term has even degree, so it is 0), which makes it a plain drop of the last coefficient - no polynomial division needed. The derivative is the same for every root, so it is computed once outside the loop
 
-      numerator = self.field.mul(self.polynomials.eval(omega, X_inverse), X)
+    omega_arr = np.asarray(omega, dtype=self.field.dtype)
+    if reedsolomon_numba is not None and self.field.size == 256: #run the batched Horner passes in the JIT compiled kernel when Numba is available (reads each coefficient list once for all evaluation points instead of once per root). The kernel accumulates in uint8, so larger fields take the vectorized fallback instead of wrapping silently
+      omega_evals = reedsolomon_numba.eval_batch(omega_arr, roots_inverse, self.field.exp_np, self.field.log_np)
+      deriv_evals = reedsolomon_numba.eval_batch(sigma_deriv, roots_inverse, self.field.exp_np, self.field.log_np)
+    else: #NumPy fallback doing the same Chien-search-style evaluation, one vectorized multiply of all accumulators per coefficient
+      _mul_vec_arr = self.field.mul_vec_arr
+      omega_evals = np.zeros(len(roots_inverse), dtype=self.field.dtype)
+      for c in omega_arr:
+        omega_evals = _mul_vec_arr(omega_evals, roots_inverse) ^ c
+      deriv_evals = np.zeros(len(roots_inverse), dtype=self.field.dtype)
+      for c in sigma_deriv:
+        deriv_evals = _mul_vec_arr(deriv_evals, roots_inverse) ^ c
 
-      error_poly[pos[i]] = self.field.div(numerator, denominator)
+    _mul, _div = self.field.mul, self.field.div #hoisted to locals, so the loop below skips the repeated attribute lookups
+    error_poly = [0]*len(msg_arr)
+    for i in range(len(roots)):
+      numerator = _mul(int(omega_evals[i]), int(roots[i])) #omega(X^(-1))*X, the numerator of the Forney formula
+      error_poly[pos[i]] = _div(numerator, int(deriv_evals[i])) #divided by sigma'(X^(-1)), the denominator (scalar div keeps the division-by-zero check of the field)
     return error_poly
 
-  def decode_erasures(self, msg: Union[Iterable[int], str], pos: Iterable[int], return_str: bool=False) -> Union[list[int], str]:
+  def decode_erasures(self, msg: Union[Iterable[int], str, bytes], pos: Iterable[int], return_str: bool=False) -> Union[list[int], str]:
     """
     Return a polynomial in list form (coefficients arranged from highest term to lowest) representing the corrected message with the provided erasure positions.
 
@@ -118,25 +226,39 @@ class ReedSolomonCodec:
     if len(pos) > self.enc_len:
       raise ValueError(f"Reed-Solomon codes can only correct up to amount of parity bits errors, currently your cap is {self.enc_len}")
 
-    decoded = []
-    slicing_idx = list(range(0, len(msg), self.field.cap)) + [len(msg)] #indexes used for slicing the message to correct lengths
+    msg_arr = self._as_arr(msg) #input materialized and validated once at the boundary, so str, bytes, lists and generators all behave the same further down
 
+    decoded = bytearray(len(msg_arr)) if self.field.size == 256 else [] #correcting erasures never changes the length, so over GF(2^8) the whole output buffer is preallocated once and every corrected slice is written straight into place
+    slicing_idx = list(range(0, len(msg_arr), self.field.cap)) + [len(msg_arr)] #indexes used for slicing the message to correct lengths
+
+    pos_sorted = sorted(pos) #sorted once, so the per-slice erasure counts below come from one linear two-pointer walk instead of filtering the whole position list again for every slice
+    lo, hi = 0, 0
     for i, j in zip(slicing_idx[:-1], slicing_idx[1:]): #iterate through pairs of values of slicing_idx with one shift (f.e. [(0, 1), (1, 2), (2, 3), (3, 4)...])
-      if len([err for err in pos if err >= i and err <= j]) > self.enc_len:
-        raise ValueError(f"too many erasures between index {i} and index {j}. This Codec can only correct up to {self.enc_len} erasures every {self.cap} characters, to fix this increase the cap or provide less erasures")
+      while lo < len(pos_sorted) and pos_sorted[lo] < i: #both pointers only ever move forward since the slice bounds increase, making the counting O(positions + slices) overall
+        lo += 1
+      while hi < len(pos_sorted) and pos_sorted[hi] <= j:
+        hi += 1
+      if hi - lo > self.enc_len:
+        raise ValueError(f"too many erasures between index {i} and index {j}. This Codec can only correct up to {self.enc_len} erasures every {self.field.cap} characters, to fix this increase the cap or provide less erasures")
 
-      slice = [ord(ch) for ch in msg[i:j]] if isinstance(msg, str) else msg[i:j]
-      decoded += self.polynomials.add(slice, self.error_poly(slice, pos))
-    return "".join([chr(i) for i in decoded]) if return_str else decoded
+      slice = msg_arr[i:j]
+      corrected = slice ^ np.asarray(self.error_poly(slice, pos), dtype=self.field.dtype) #subtracting the error polynomial is an element-wise XOR of two same-length arrays, no need for the general polynomial addition
+      if isinstance(decoded, bytearray):
+        decoded[i:j] = corrected.tobytes() #one C-level slice assignment into the preallocated buffer
+      else:
+        decoded += corrected.tolist()
+    if return_str:
+      return bytes(decoded).decode("latin-1") if self.field.size == 256 else "".join([chr(i) for i in decoded]) #the reverse of the conversion above: one C-level decode builds the whole string over GF(2^8), larger fields keep the per-character join
+    return list(decoded) if isinstance(decoded, bytearray) else decoded #callers still get the usual list of ints back
 
-  def erasure_sim(self, msg: Iterable[int], pos: Iterable[int]) -> list[int]:
+  def erasure_sim(self, msg: Union[Iterable[int], str, bytes], pos: Iterable[int]) -> list[int]:
     """
     Return a polynomial in list form (coefficients arranged from highest term to lowest) with coefficients at provided erasure positions set to 0.
     """
-    if max(pos) >= len(msg):
+    res = self._as_arr(msg) #materialized and validated once at the boundary (_check hands back a fresh array, so the scatter below never mutates caller data)
+    pos_arr = np.asarray(pos, dtype=np.intp)
+    if pos_arr.size and pos_arr.max() >= res.size: #one C-level bounds check over all positions at once
       raise ValueError("erasure position indexes out of range of the message")
-    
-    res = list(msg)
-    for i in pos:
-      res[i] = 0
-    return res
\ No newline at end of file
+
+    res[pos_arr] = 0 #zero out every erasure position with one vectorized scatter
+    return res.tolist()
\ No newline at end of file
@@ -0,0 +1,48 @@
+import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def syndromes_poly(msg: np.ndarray, enc_len: int, expLUT: np.ndarray, logLUT: np.ndarray) -> np.ndarray: #JIT compiled inner loop of ReedSolomonCodec.syndromes_poly
+  """
+  Return the syndromes (syndrome i is the message evaluated at α^i) in ascending order of i as a uint8 array, computed as one Horner pass over the message that updates all enc_len accumulators per coefficient, so the message is read once instead of once per syndrome.
+
+  Note: The uint8 accumulators only fit GF(2^8), the caller must dispatch here for that field size alone.
+  """
+  acc = np.zeros(enc_len, dtype=np.uint8)
+  for c in msg: #Horner's method: every accumulator k becomes acc*α^k + c each step
+    for k in range(enc_len):
+      acc[k] = expLUT[logLUT[acc[k]] + k] ^ c #log(α^k) is just k, so multiplying by the evaluation point is a single table lookup (a 0 accumulator lands in the zero tail through the log(0) sentinel)
+  return acc
+
+@njit(cache=True)
+def eval_batch(p: np.ndarray, xs: np.ndarray, expLUT: np.ndarray, logLUT: np.ndarray) -> np.ndarray: #JIT compiled batched polynomial evaluation for ReedSolomonCodec.error_poly
+  """
+  Return the polynomial 'p' (coefficients arranged from highest term to lowest) evaluated at every point of 'xs' at once as a uint8 array, computed as one Horner pass over the coefficients that updates all len(xs) accumulators per coefficient, so the coefficient list is read once instead of once per evaluation point.
+
+  Note: The uint8 accumulators only fit GF(2^8), the caller must dispatch here for that field size alone.
+  """
+  acc = np.zeros(len(xs), dtype=np.uint8)
+  for c in p: #Horner's method: every accumulator k becomes acc*xs[k] + c each step
+    for k in range(len(xs)):
+      acc[k] = expLUT[logLUT[acc[k]] + logLUT[xs[k]]] ^ c #a 0 accumulator lands in the zero tail through the log(0) sentinel, the evaluation points themselves are powers of α and never 0
+  return acc
+
+@njit(cache=True)
+def encode_lfsr(msg: np.ndarray, gen_mul: np.ndarray, rem: np.ndarray) -> None: #JIT compiled inner loop of ReedSolomonCodec.__single_encode
+  """
+  Feed the whole message through the systematic shift register encoder, filling the preallocated remainder buffer 'rem' in place. 'gen_mul' holds the precomputed multiplication table of the generator tail (gen_mul[j, v] = gen_tail[j]*v), so every GF multiply in the loop is a single indexed load.
+  """
+  enc_len = len(rem)
+  for c in msg:
+    factor = c ^ rem[0] #the leading remainder byte combines with the incoming byte to give the feedback factor
+    for j in range(enc_len-1): #shift the register up one position while accumulating the feedback times the generator tail
+      rem[j] = rem[j+1] ^ gen_mul[j, factor]
+    rem[enc_len-1] = gen_mul[enc_len-1, factor]
+
+@njit(cache=True)
+def encode_lfsr_batch(msgs: np.ndarray, gen_mul: np.ndarray, rems: np.ndarray) -> None: #JIT compiled batched version of encode_lfsr for ReedSolomonCodec.encode
+  """
+  Run the shift register encoder over every row of the 2D message matrix 'msgs' at once, filling the matching row of the preallocated remainder matrix 'rems' in place. The rows are independent codewords sharing the same generator table, so the whole batch is encoded in a single call.
+  """
+  for r in range(msgs.shape[0]):
+    encode_lfsr(msgs[r], gen_mul, rems[r])
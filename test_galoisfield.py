@@ -0,0 +1,26 @@
+from galoisfield import GaloisField
+
+def test_gf256_construction():
+  """
+  The default GF(2^8) field must build its tables and keep the basic arithmetic identities intact.
+  """
+  field = GaloisField()
+  assert field.expLUT[0] == 1 #α^0 = 1
+  assert field.logLUT[1] == 0
+  assert field.mul(0, 123) == 0 #the log(0) sentinel must send any product with a 0 operand to 0
+  for x in (1, 2, 71, 254, 255):
+    assert field.expLUT[field.logLUT[x]] == x #exp and log must stay inverse of each other
+    assert field.mul(x, field.inverse(x)) == 1
+
+def test_gf2_16_construction():
+  """
+  GF(2^16) tables must fit the compact storage without overflowing (entries and the log(0) sentinel outgrow 2-byte elements above GF(2^14)).
+  """
+  field = GaloisField(2, 16, 2, 69643) #primitive polynomial [x^16 + x^12 + x^3 + x + 1]
+  assert field.size == 65536
+  assert field.expLUT[0] == 1
+  assert field.logLUT[0] == 2*(field.size-1) #the sentinel must survive the storage conversion unclipped
+  assert field.mul(0, 54321) == 0
+  for x in (1, 2, 257, 54321, 65535):
+    assert field.expLUT[field.logLUT[x]] == x
+    assert field.mul(x, field.inverse(x)) == 1
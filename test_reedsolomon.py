@@ -0,0 +1,22 @@
+from reedsolomon import ReedSolomonCodec
+
+def test_gf256_roundtrip():
+  """
+  The default GF(2^8) codec must recover erased positions of an encoded message.
+  """
+  codec = ReedSolomonCodec(6)
+  msg = [174, 70, 54, 61, 113, 29, 152, 107, 224, 74, 110, 112]
+  encoded = codec.encode(msg)
+  erased = codec.erasure_sim(encoded, [0, 5, 13])
+  assert codec.decode_erasures(erased, [0, 5, 13]) == encoded
+
+def test_gf2_12_roundtrip():
+  """
+  The codec must work for fields above GF(2^8) end to end: coefficients over 255 have to survive encoding and erasure decoding without being truncated anywhere in the polynomial or codec layers.
+  """
+  codec = ReedSolomonCodec(6, n=12, prim_poly=4179) #primitive polynomial [x^12 + x^6 + x^4 + x + 1]
+  msg = [1949, 4000, 7, 0, 255, 256, 3033, 4094, 1024, 512]
+  encoded = codec.encode(msg)
+  assert encoded[:len(msg)] == msg #systematic encoding must keep the wide message coefficients untouched
+  erased = codec.erasure_sim(encoded, [0, 7, 12])
+  assert codec.decode_erasures(erased, [0, 7, 12]) == encoded